@@ -35,6 +35,23 @@ os.makedirs(constants.LOGS_DIR, exist_ok=True)
 
 CPU_COUNT = mp.cpu_count()
 
+_IMMUTABLE_CFG_TYPES = (str, int, float, bool, type(None))
+
+
+def _fast_cfg_copy(cfg):
+    """
+    Copies a JSON-like config (dicts, lists and scalars) avoiding the
+    copy.deepcopy() overhead. Other types fall back to copy.deepcopy()
+    """
+    cfg_type = type(cfg)
+    if cfg_type is dict:
+        return {key: _fast_cfg_copy(value) for key, value in cfg.items()}
+    if cfg_type is list:
+        return [_fast_cfg_copy(value) for value in cfg]
+    if cfg_type in _IMMUTABLE_CFG_TYPES:
+        return cfg
+    return copy.deepcopy(cfg)
+
 
 def load_yaml_config(config_filename):
     import yaml
@@ -130,7 +147,7 @@ def default_config(config_data=None, config_overwrite={}):
     """
     logger.info('Lithops v{}'.format(__version__))
 
-    config_data = copy.deepcopy(config_data) or load_config()
+    config_data = _fast_cfg_copy(config_data) or load_config()
 
     if 'lithops' not in config_data or not config_data['lithops']:
         config_data['lithops'] = {}
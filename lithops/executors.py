@@ -17,12 +17,10 @@
 
 import os
 import sys
-import copy
 import logging
 import atexit
 import pickle
 import tempfile
-import numpy as np
 import subprocess as sp
 from datetime import datetime
 from lithops import constants
@@ -37,9 +35,6 @@ from lithops.constants import LOCALHOST, CLEANER_DIR, \
     CLEANER_LOG_FILE, SERVERLESS, STANDALONE
 from lithops.utils import is_notebook, setup_lithops_logger, \
     is_lithops_worker, create_executor_id, create_futures_list
-from lithops.localhost.localhost import LocalhostHandler
-from lithops.standalone.standalone import StandaloneHandler
-from lithops.serverless.serverless import ServerlessHandler
 from lithops.storage.utils import create_job_key
 from lithops.monitor import JobMonitor
 from lithops.utils import FuturesList
@@ -68,6 +63,7 @@ class FunctionExecutor:
         """ Create a FunctionExecutor Class """
 
         self.is_lithops_worker = is_lithops_worker()
+        self.is_notebook = is_notebook()
 
         # setup lithops logging
         if not self.is_lithops_worker:
@@ -97,13 +93,17 @@ class FunctionExecutor:
         if monitoring is not None:
             config_ow['lithops']['monitoring'] = monitoring
 
-        self.config = default_config(copy.deepcopy(config), config_ow)
+        self.config = default_config(config, config_ow)
+
+        lithops_cfg = self.config['lithops']
 
         self.executor_id = create_executor_id()
 
-        self.data_cleaner = self.config['lithops'].get('data_cleaner', True)
+        self.data_cleaner = lithops_cfg.get('data_cleaner', True)
         if self.data_cleaner and not self.is_lithops_worker:
-            spawn_cleaner = int(self.executor_id.split('-')[1]) == 0
+            # atexit runs the handlers in reverse order, so the first executor
+            # spawns the cleaner once all the others have saved their jobs
+            spawn_cleaner = self.executor_id.endswith('-0')
             atexit.register(self.clean, spawn_cleaner=spawn_cleaner,
                             clean_cloudobjects=False)
 
@@ -112,22 +112,28 @@ class FunctionExecutor:
         self.storage = self.internal_storage.storage
 
         self.futures = []
+        self.job_keys = set()
         self.cleaned_jobs = set()
         self.total_jobs = 0
         self.last_call = None
 
-        if self.config['lithops']['mode'] == LOCALHOST:
+        mode = lithops_cfg['mode']
+        # Only the compute handler of the selected mode is imported
+        if mode == LOCALHOST:
+            from lithops.localhost.localhost import LocalhostHandler
             localhost_config = extract_localhost_config(self.config)
             self.compute_handler = LocalhostHandler(localhost_config)
-        elif self.config['lithops']['mode'] == SERVERLESS:
+        elif mode == SERVERLESS:
+            from lithops.serverless.serverless import ServerlessHandler
             serverless_config = extract_serverless_config(self.config)
             self.compute_handler = ServerlessHandler(serverless_config, self.internal_storage)
-        elif self.config['lithops']['mode'] == STANDALONE:
+        elif mode == STANDALONE:
+            from lithops.standalone.standalone import StandaloneHandler
             standalone_config = extract_standalone_config(self.config)
             self.compute_handler = StandaloneHandler(standalone_config)
 
         # Create the monitoring system
-        monitoring_backend = self.config['lithops']['monitoring'].lower()
+        monitoring_backend = lithops_cfg['monitoring'].lower()
         monitoring_config = self.config.get(monitoring_backend)
         self.job_monitor = JobMonitor(monitoring_backend, monitoring_config)
 
@@ -139,9 +145,10 @@ class FunctionExecutor:
                                       self.job_monitor)
 
         logger.debug('Function executor for {} created with ID: {}'
-                     .format(self.config['lithops']['backend'], self.executor_id))
+                     .format(lithops_cfg['backend'], self.executor_id))
 
         self.log_path = None
+        self.log_summary = None
 
     def __enter__(self):
         """ Context manager method """
@@ -153,9 +160,9 @@ class FunctionExecutor:
         self.invoker.stop()
 
     def _create_job_id(self, call_type):
-        job_id = str(self.total_jobs).zfill(3)
+        job_id = f'{call_type}{self.total_jobs:03d}'
         self.total_jobs += 1
-        return '{}{}'.format(call_type, job_id)
+        return job_id
 
     def call_async(self, func, data, extra_env=None, runtime_memory=None,
                    timeout=None, include_modules=[], exclude_modules=[]):
@@ -194,6 +201,7 @@ class FunctionExecutor:
 
         futures = self.invoker.run_job(job)
         self.futures.extend(futures)
+        self.job_keys.add(job.job_key)
 
         return futures[0]
 
@@ -256,6 +264,7 @@ class FunctionExecutor:
 
         futures = self.invoker.run_job(job)
         self.futures.extend(futures)
+        self.job_keys.add(job.job_key)
 
         if isinstance(map_iterdata, FuturesList):
             for fut in map_iterdata:
@@ -325,6 +334,7 @@ class FunctionExecutor:
 
         map_futures = self.invoker.run_job(map_job)
         self.futures.extend(map_futures)
+        self.job_keys.add(map_job.job_key)
 
         if isinstance(map_iterdata, FuturesList):
             for fut in map_iterdata:
@@ -353,11 +363,15 @@ class FunctionExecutor:
 
         reduce_futures = self.invoker.run_job(reduce_job)
         self.futures.extend(reduce_futures)
+        self.job_keys.add(reduce_job.job_key)
 
         for f in map_futures:
             f._produce_output = False
 
-        return create_futures_list(map_futures + reduce_futures, self)
+        futures = create_futures_list(map_futures, self)
+        futures.extend(reduce_futures)
+
+        return futures
 
     def wait(self, fs=None, throw_except=True, return_when=ALL_COMPLETED,
              download_results=False, timeout=None, threadpool_size=THREADPOOL_SIZE,
@@ -376,7 +390,8 @@ class FunctionExecutor:
         :param download_results: Download results. Default false (Only get statuses)
         :param timeout: Timeout of waiting for results.
         :param threadpool_size: Number of threads to use. Default 64
-        :param wait_dur_sec: Time interval between each check.
+        :param wait_dur_sec: Max time to block between checks if the job monitor
+                             does not notify any ready future.
 
         :return: `(fs_done, fs_notdone)`
             where `fs_done` is a list of futures that have completed
@@ -384,7 +399,7 @@ class FunctionExecutor:
         :rtype: 2-tuple of list
         """
         futures = fs or self.futures
-        if type(futures) != list and type(futures) != FuturesList:
+        if not isinstance(futures, list):
             futures = [futures]
 
         # Start waiting for results
@@ -401,7 +416,7 @@ class FunctionExecutor:
 
         except Exception as e:
             self.invoker.stop()
-            if not fs and is_notebook():
+            if not fs and self.is_notebook:
                 del self.futures[len(self.futures) - len(futures):]
             if self.data_cleaner and not self.is_lithops_worker:
                 self.clean(clean_cloudobjects=False, force=True)
@@ -414,12 +429,13 @@ class FunctionExecutor:
                 self.compute_handler.clear(present_jobs)
                 self.clean(clean_cloudobjects=False)
 
-        if download_results:
-            fs_done = [f for f in futures if f.done]
-            fs_notdone = [f for f in futures if not f.done]
-        else:
-            fs_done = [f for f in futures if f.success or f.done]
-            fs_notdone = [f for f in futures if not f.success and not f.done]
+        fs_done = []
+        fs_notdone = []
+        for f in futures:
+            if f.done or (not download_results and f.success):
+                fs_done.append(f)
+            else:
+                fs_notdone.append(f)
 
         return create_futures_list(fs_done, self), create_futures_list(fs_notdone, self)
 
@@ -471,7 +487,7 @@ class FunctionExecutor:
         """
         ftrs = self.futures if not fs else fs
 
-        if type(ftrs) != list:
+        if not isinstance(ftrs, list):
             ftrs = [ftrs]
 
         ftrs_to_plot = [f for f in ftrs if (f.success or f.done) and not f.error]
@@ -504,8 +520,17 @@ class FunctionExecutor:
         os.makedirs(CLEANER_DIR, exist_ok=True)
 
         def save_data_to_clean(data):
-            with tempfile.NamedTemporaryFile(dir=CLEANER_DIR, delete=False) as temp:
-                pickle.dump(data, temp)
+            # Written under a .tmp name first, so that a running cleaner never
+            # loads a partially written file
+            with tempfile.NamedTemporaryFile(dir=CLEANER_DIR, delete=False, suffix='.tmp',
+                                             buffering=1024**2) as temp:
+                try:
+                    pickle.dump(data, temp, pickle.HIGHEST_PROTOCOL)
+                except Exception:
+                    temp.close()
+                    os.remove(temp.name)
+                    raise
+            os.replace(temp.name, temp.name[:-len('.tmp')])
 
         if cs:
             data = {'cos_to_clean': list(cs),
@@ -515,24 +540,31 @@ class FunctionExecutor:
                 return
 
         futures = fs or self.futures
-        futures = [futures] if type(futures) != list else futures
-        present_jobs = {create_job_key(f.executor_id, f.job_id) for f in futures
-                        if (f.executor_id.count('-') == 1 and f.done) or force}
+        futures = futures if isinstance(futures, list) else [futures]
+        present_jobs = frozenset(f.job_key for f in futures
+                                 if (f.executor_id.count('-') == 1 and f.done) or force)
         jobs_to_clean = present_jobs - self.cleaned_jobs
 
+        if jobs_to_clean and self.job_keys <= self.cleaned_jobs | jobs_to_clean:
+            # No pending job can use the uploaded function objects anymore
+            func_job_ids = self.internal_storage.uploaded_funcs.pop(self.executor_id, {}).values()
+            jobs_to_clean |= {create_job_key(self.executor_id, func_job_id)
+                              for func_job_id in func_job_ids}
+
         if jobs_to_clean:
             logger.info("ExecutorID {} - Cleaning temporary data"
                         .format(self.executor_id))
-            data = {'jobs_to_clean': jobs_to_clean,
+            data = {'jobs_to_clean': list(jobs_to_clean),
                     'clean_cloudobjects': clean_cloudobjects,
                     'storage_config': self.internal_storage.get_storage_config()}
             save_data_to_clean(data)
             self.cleaned_jobs.update(jobs_to_clean)
 
         if (jobs_to_clean or cs) and spawn_cleaner:
-            log_file = open(CLEANER_LOG_FILE, 'a')
             cmdstr = [sys.executable, '-m', 'lithops.scripts.cleaner']
-            sp.Popen(' '.join(cmdstr), shell=True, stdout=log_file, stderr=log_file)
+            with open(CLEANER_LOG_FILE, 'a') as log_file:
+                sp.Popen(cmdstr, stdout=log_file, stderr=log_file,
+                         close_fds=True, start_new_session=True)
 
     def job_summary(self, cloud_objects_n=0):
         """
@@ -542,69 +574,53 @@ class FunctionExecutor:
 
         :param cloud_objects_n: number of cloud object used in COS, declared by user.
         """
+        import numpy as np
         import pandas as pd
 
-        def init():
-            headers = ['Job_ID', 'Function', 'Invocations', 'Memory(MB)', 'AvgRuntime', 'Cost', 'CloudObjects']
-            pd.DataFrame([], columns=headers).to_csv(self.log_path, index=False)
-
-        def append(content):
-            """ appends job information to log file."""
-            pd.DataFrame(content).to_csv(self.log_path, mode='a', header=False, index=False)
-
-        def append_summary():
-            """ add a summary row to the log file"""
-            df = pd.read_csv(self.log_path)
-            total_average = sum(df.AvgRuntime * df.Invocations) / df.Invocations.sum()
-            total_row = pd.DataFrame([['Summary', ' ', df.Invocations.sum(), df['Memory(MB)'].sum(),
-                                       round(total_average, 10), df.Cost.sum(), cloud_objects_n]])
-            total_row.to_csv(self.log_path, mode='a', header=False, index=False)
-
-        def get_object_num():
-            """returns cloud objects used up to this point, using this function executor. """
-            df = pd.read_csv(self.log_path)
-            return float(df.iloc[-1].iloc[-1])
+        headers = ['Job_ID', 'Function', 'Invocations', 'Memory(MB)', 'AvgRuntime', 'Cost', 'CloudObjects']
 
         # Avoid logging info unless chosen computational backend is supported.
         if hasattr(self.compute_handler.backend, 'calc_cost'):
 
-            if self.log_path:  # retrieve cloud_objects_n from last log file
-                cloud_objects_n += get_object_num()
+            if self.log_path:  # retrieve cloud_objects_n from last summary
+                cloud_objects_n += float(self.log_summary.iloc[-1, -1])
             else:
                 self.log_path = os.path.join(constants.LOGS_DIR, datetime.now().strftime("%Y-%m-%d_%H:%M:%S.csv"))
-            # override current logfile
-            init()
 
             futures = self.futures
-            if type(futures) != list:
+            if not isinstance(futures, list):
                 futures = [futures]
 
-            memory = []
-            runtimes = []
-            curr_job_id = futures[0].job_id
-            job_func = futures[0].function_name  # each job is conducted on a single function
-
-            for future in futures:
-                if curr_job_id != future.job_id:
-                    cost = self.compute_handler.backend.calc_cost(runtimes, memory)
-                    append([[curr_job_id, job_func, len(runtimes), sum(memory),
-                             np.round(np.average(runtimes), 10), cost, ' ']])
-
-                    # updating next iteration's variables:
-                    curr_job_id = future.job_id
-                    job_func = future.function_name
-                    memory.clear()
-                    runtimes.clear()
-
-                memory.append(future.runtime_memory)
-                runtimes.append(future.stats['worker_exec_time'])
-
-            # appends last Job-ID
-            cost = self.compute_handler.backend.calc_cost(runtimes, memory)
-            append([[curr_job_id, job_func, len(runtimes), sum(memory),
-                     np.round(np.average(runtimes), 10), cost, ' ']])
+            job_ids = np.array([f.job_id for f in futures])
+            memory = np.fromiter((f.runtime_memory for f in futures),
+                                 dtype=np.int64, count=len(futures))
+            runtimes = np.fromiter((f.stats['worker_exec_time'] for f in futures),
+                                   dtype=np.float64, count=len(futures))
+
+            # futures of a job are contiguous, so a new group starts wherever the job id changes
+            starts = np.flatnonzero(np.r_[True, job_ids[1:] != job_ids[:-1]])
+            ends = np.r_[starts[1:], len(futures)]
+            invocations = ends - starts
+            total_memory = np.add.reduceat(memory, starts)
+            avg_runtimes = np.round(np.add.reduceat(runtimes, starts) / invocations, 10)
+
+            rows = []
+            for start, end, calls, mem, avg_runtime in zip(starts, ends, invocations,
+                                                            total_memory, avg_runtimes):
+                cost = self.compute_handler.backend.calc_cost(runtimes[start:end], memory[start:end])
+                # each job is conducted on a single function
+                rows.append([job_ids[start], futures[start].function_name,
+                             calls, mem, avg_runtime, cost, ' '])
+            df = pd.DataFrame(rows, columns=headers)
+
             # append summary row to end of the dataframe
-            append_summary()
+            total_average = (df.AvgRuntime * df.Invocations).sum() / df.Invocations.sum()
+            df.loc[len(df)] = ['Summary', ' ', df.Invocations.sum(), df['Memory(MB)'].sum(),
+                               round(total_average, 10), df.Cost.sum(), cloud_objects_n]
+
+            # override current logfile
+            df.to_csv(self.log_path, index=False)
+            self.log_summary = df
 
         else:  # calc_cost() doesn't exist for chosen computational backend.
             logger.warning("Could not log job: {} backend isn't supported by this function."
@@ -27,8 +27,7 @@ import traceback
 from six import reraise
 
 from lithops.storage import InternalStorage
-from lithops.storage.utils import check_storage_path, get_storage_path,\
-    create_job_key
+from lithops.storage.utils import check_storage_path, get_storage_path
 from lithops.constants import FN_LOG_FILE, LOGS_DIR
 
 logger = logging.getLogger(__name__)
@@ -205,8 +204,7 @@ class ResponseFuture:
 
         if 'logs' in self._call_status:
             self.logs = zlib.decompress(base64.b64decode(self._call_status['logs'].encode())).decode()
-            job_key = create_job_key(self.executor_id, self.job_id)
-            log_file = os.path.join(LOGS_DIR, job_key+'.log')
+            log_file = os.path.join(LOGS_DIR, self.job_key+'.log')
             header = "Activation: '{}' ({})\n[\n".format(self.runtime_name, self.activation_id)
             tail = ']\n\n'
             output = self.logs.replace('\r', '').replace('\n', '\n    ', self.logs.count('\n')-1)
@@ -93,6 +93,9 @@ class Invoker:
 
         self.customized_runtime = self.config[self.mode].get('customized_runtime', False)
 
+        # runtime metadata already verified by select_runtime()
+        self.runtime_meta_cache = {}
+
     def select_runtime(self, job_id, runtime_memory):
         """
         Return the runtime metadata
@@ -113,6 +116,9 @@ class Invoker:
         logger.info(msg)
 
         runtime_key = self.compute_handler.get_runtime_key(self.runtime_name, runtime_memory)
+        if runtime_key in self.runtime_meta_cache:
+            return self.runtime_meta_cache[runtime_key]
+
         runtime_meta = self.internal_storage.get_runtime_meta(runtime_key)
 
         if not runtime_meta:
@@ -135,6 +141,8 @@ class Invoker:
                              "is not compatible with the local Python version {}")
                             .format(self.runtime_name, py_remote_version, py_local_version))
 
+        self.runtime_meta_cache[runtime_key] = runtime_meta
+
         return runtime_meta
 
     def _create_payload(self, job):
@@ -163,6 +171,14 @@ class Invoker:
 
         return payload
 
+    def _get_call_ids(self, job):
+        """
+        Returns the call ids to invoke. A remote invoker spawned by a
+        fanout only handles the range of calls it was assigned
+        """
+        call_ids_range = getattr(job, 'call_ids_range', None)
+        return range(*call_ids_range) if call_ids_range else range(job.total_calls)
+
     def _run_job(self, job):
         """
         Run a job
@@ -204,7 +220,7 @@ class Invoker:
 
         # Create all futures
         futures = []
-        for i in range(job.total_calls):
+        for i in self._get_call_ids(job):
             call_id = "{:05d}".format(i)
             fut = ResponseFuture(call_id, job,
                                  job.metadata.copy(),
@@ -296,7 +312,8 @@ class FaaSInvoker(Invoker):
                     except KeyboardInterrupt:
                         break
                     if self.should_run:
-                        executor.submit(self._invoke_task, job, call_ids_range)
+                        future = executor.submit(self._invoke_task, job, call_ids_range)
+                        future.add_done_callback(lambda f: self.pending_calls_q.task_done())
                     else:
                         break
 
@@ -340,12 +357,14 @@ class FaaSInvoker(Invoker):
         call_ids = ["{:05d}".format(i) for i in call_ids_range]
         payload['call_ids'] = call_ids
 
+        # The data of a remote invoker spawned by a fanout starts at its range
+        data_offset = getattr(job, 'data_offset', 0)
         if job.data_key:
-            data_byte_ranges = [job.data_byte_ranges[int(call_id)] for call_id in call_ids]
+            data_byte_ranges = [job.data_byte_ranges[i - data_offset] for i in call_ids_range]
             payload['data_byte_ranges'] = data_byte_ranges
         else:
             del payload['data_byte_ranges']
-            payload['data_byte_strs'] = [job.data_byte_strs[int(call_id)] for call_id in call_ids]
+            payload['data_byte_strs'] = [job.data_byte_strs[i - data_offset] for i in call_ids_range]
 
         # do the invocation
         start = time.time()
@@ -403,7 +422,7 @@ class FaaSInvoker(Invoker):
         if self.running_workers < self.workers:
             free_workers = self.workers - self.running_workers
             total_direct = free_workers * job.chunksize
-            callids = range(job.total_calls)
+            callids = self._get_call_ids(job)
             callids_to_invoke_direct = callids[:total_direct]
             callids_to_invoke_nondirect = callids[total_direct:]
 
@@ -443,7 +462,7 @@ class FaaSInvoker(Invoker):
                          'workers, queuing {} function activations'
                          .format(job.executor_id, job.job_id,
                                  self.workers, job.total_calls))
-            for call_ids_range in iterchunks(range(job.total_calls), job.chunksize):
+            for call_ids_range in iterchunks(self._get_call_ids(job), job.chunksize):
                 self.pending_calls_q.put((job, call_ids_range))
 
     def run_job(self, job):
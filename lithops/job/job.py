@@ -22,6 +22,8 @@ import hashlib
 import inspect
 import pickle
 import logging
+import threading
+from functools import lru_cache
 from types import SimpleNamespace
 
 from lithops import utils
@@ -35,6 +37,13 @@ from lithops.constants import MAX_AGG_DATA_SIZE, JOBS_PREFIX, LOCALHOST,\
 
 logger = logging.getLogger(__name__)
 
+# file path -> ((mtime, size), md5 hash)
+_file_hashes = {}
+
+# id(runtime meta) -> (runtime meta, serializer)
+_SERIALIZERS_SIZE = 16
+_serializers = {}
+
 
 def create_map_job(config, internal_storage, executor_id, job_id, map_function,
                    iterdata,  runtime_meta, runtime_memory, extra_env,
@@ -142,15 +151,16 @@ def _create_job(config, internal_storage, executor_id, job_id, func,
     """
     Creates a new Job
     """
-    ext_env = {} if extra_env is None else extra_env.copy()
+    ext_env = utils.convert_bools_to_string(extra_env) if extra_env else {}
     if ext_env:
-        ext_env = utils.convert_bools_to_string(ext_env)
         logger.debug("Extra environment vars {}".format(ext_env))
 
+    lithops_cfg = config['lithops']
+
     job = SimpleNamespace()
-    job.chunksize = chunksize or config['lithops']['chunksize']
-    job.worker_processes = worker_processes or config['lithops']['worker_processes']
-    job.execution_timeout = execution_timeout or config['lithops']['execution_timeout']
+    job.chunksize = chunksize or lithops_cfg['chunksize']
+    job.worker_processes = worker_processes or lithops_cfg['worker_processes']
+    job.execution_timeout = execution_timeout or lithops_cfg['execution_timeout']
     job.executor_id = executor_id
     job.job_id = job_id
     job.job_key = create_job_key(job.executor_id, job.job_id)
@@ -158,8 +168,8 @@ def _create_job(config, internal_storage, executor_id, job_id, func,
     job.function_name = func.__name__ if inspect.isfunction(func) or inspect.ismethod(func) else type(func).__name__
     job.total_calls = len(iterdata)
 
-    mode = config['lithops']['mode']
-    backend = config['lithops']['backend']
+    mode = lithops_cfg['mode']
+    backend = lithops_cfg['backend']
 
     if mode == SERVERLESS:
         job.invoke_pool_threads = invoke_pool_threads or config[backend].get('invoke_pool_threads', 1)
@@ -178,8 +188,8 @@ def _create_job(config, internal_storage, executor_id, job_id, func,
         job.runtime_memory = None
         job.runtime_timeout = execution_timeout
 
-    exclude_modules_cfg = config['lithops'].get('exclude_modules', [])
-    include_modules_cfg = config['lithops'].get('include_modules', [])
+    exclude_modules_cfg = lithops_cfg.get('exclude_modules', [])
+    include_modules_cfg = lithops_cfg.get('include_modules', [])
 
     exc_modules = set()
     inc_modules = set()
@@ -198,12 +208,13 @@ def _create_job(config, internal_storage, executor_id, job_id, func,
 
     logger.debug('ExecutorID {} | JobID {} - Serializing function and data'.format(executor_id, job_id))
     job_serialize_start = time.time()
-    serializer = SerializeIndependent(runtime_meta['preinstalls'])
+    serializer = _get_serializer(runtime_meta)
     func_and_data_ser, mod_paths = serializer([func] + iterdata, inc_modules, exc_modules)
     data_strs = func_and_data_ser[1:]
     data_size_bytes = sum(len(x) for x in data_strs)
     module_data = create_module_data(mod_paths)
     func_str = func_and_data_ser[0]
+    del func_and_data_ser
     func_module_str = pickle.dumps({'func': func_str, 'module_data': module_data}, -1)
     func_module_size_bytes = len(func_module_str)
 
@@ -212,8 +223,8 @@ def _create_job(config, internal_storage, executor_id, job_id, func,
     host_job_meta['func_module_size_bytes'] = func_module_size_bytes
 
     # Check data limit
-    if 'data_limit' in config['lithops']:
-        data_limit = config['lithops']['data_limit']
+    if 'data_limit' in lithops_cfg:
+        data_limit = lithops_cfg['data_limit']
     else:
         data_limit = MAX_AGG_DATA_SIZE
     if data_limit and data_size_bytes > data_limit*1024**2:
@@ -223,53 +234,89 @@ def _create_job(config, internal_storage, executor_id, job_id, func,
 
     # Upload function and data
     upload_function = not config[mode].get('customized_runtime', False)
-    upload_data = not (len(str(data_strs[0])) * job.chunksize < 8*1204 and backend in FAAS_BACKENDS)
+    # The data goes base64 encoded in the invocation payload
+    max_data_size = max(len(data_str) for data_str in data_strs)
+    upload_data = not ((max_data_size + 2) // 3 * 4 * job.chunksize < 8*1024
+                       and backend in FAAS_BACKENDS)
 
     # Upload function and modules
+    func_upload = None
     if upload_function:
-        func_upload_start = time.time()
-        logger.debug('ExecutorID {} | JobID {} - Uploading function and modules '
-                     'to the storage backend'.format(executor_id, job_id))
-        job.func_key = create_func_key(JOBS_PREFIX, executor_id, job_id)
-        internal_storage.put_func(job.func_key, func_module_str)
-        func_upload_end = time.time()
-        host_job_meta['host_func_upload_time'] = round(func_upload_end - func_upload_start, 6)
+        # Jobs of the same executor with the same function share its object
+        func_hash = hashlib.md5(func_module_str).hexdigest()
+        uploaded_funcs = internal_storage.uploaded_funcs.setdefault(executor_id, {})
+        if func_hash in uploaded_funcs:
+            job.func_key = create_func_key(JOBS_PREFIX, executor_id, uploaded_funcs[func_hash])
+            logger.debug('ExecutorID {} | JobID {} - Function and modules already '
+                         'uploaded in {}'.format(executor_id, job_id, job.func_key))
+            host_job_meta['host_func_upload_time'] = 0
+        else:
+            logger.debug('ExecutorID {} | JobID {} - Uploading function and modules '
+                         'to the storage backend'.format(executor_id, job_id))
+            func_job_id = 'F{}'.format(job_id)
+            job.func_key = create_func_key(JOBS_PREFIX, executor_id, func_job_id)
+
+            func_upload_errors = []
+
+            def put_func():
+                try:
+                    func_upload_start = time.time()
+                    internal_storage.put_func(job.func_key, func_module_str)
+                    func_upload_end = time.time()
+                    host_job_meta['host_func_upload_time'] = round(func_upload_end - func_upload_start, 6)
+                except Exception as e:
+                    func_upload_errors.append(e)
+
+            # Uploaded in background, overlapped with the data upload
+            func_upload = threading.Thread(target=put_func, daemon=True)
+            func_upload.start()
 
     else:
         # Prepare function and modules locally to store in the runtime image later
         function_file = func.__code__.co_filename
-        function_hash = hashlib.md5(open(function_file, 'rb').read()).hexdigest()[:16]
-        mod_hash = hashlib.md5(repr(sorted(mod_paths)).encode('utf-8')).hexdigest()[:16]
+        function_hash = _get_file_hash(function_file)
+        mod_hash = _get_mod_paths_hash(frozenset(mod_paths))
         job.func_key = func_key_suffix
         job.ext_runtime_uuid = '{}{}'.format(function_hash, mod_hash)
         job.local_tmp_dir = os.path.join(CUSTOM_RUNTIME_DIR, job.ext_runtime_uuid)
         _store_func_and_modules(job.local_tmp_dir, job.func_key, func_str, module_data)
         host_job_meta['host_func_upload_time'] = 0
 
-    # upload data
-    if upload_data:
-        # Upload iterdata to COS only if a single element is greater than 8KB
-        logger.debug('ExecutorID {} | JobID {} - Uploading data to the storage backend'
-                     .format(executor_id, job_id))
-        # pass_iteradata through an object storage file
-        data_key = create_agg_data_key(JOBS_PREFIX, executor_id, job_id)
-        job.data_key = data_key
-        data_bytes, data_byte_ranges = utils.agg_data(data_strs)
-        job.data_byte_ranges = data_byte_ranges
-        data_upload_start = time.time()
-        internal_storage.put_data(data_key, data_bytes)
-        data_upload_end = time.time()
-        host_job_meta['host_data_upload_time'] = round(data_upload_end-data_upload_start, 6)
-
-    else:
-        # pass iteradata as part of the invocation payload
-        logger.debug('ExecutorID {} | JobID {} - Data per activation is < '
-                     '{}. Passing data through invocation payload'
-                     .format(executor_id, job_id, utils.sizeof_fmt(8*1024)))
-        job.data_key = None
-        job.data_byte_ranges = None
-        job.data_byte_strs = data_strs
-        host_job_meta['host_data_upload_time'] = 0
+    try:
+        # upload data
+        if upload_data:
+            # Upload iterdata to COS only if a single element is greater than 8KB
+            logger.debug('ExecutorID {} | JobID {} - Uploading data to the storage backend'
+                         .format(executor_id, job_id))
+            # pass_iteradata through an object storage file
+            data_key = create_agg_data_key(JOBS_PREFIX, executor_id, job_id)
+            job.data_key = data_key
+            data_bytes, data_byte_ranges = utils.agg_data(data_strs)
+            # Release the per-call payloads, so only data_bytes is kept during the upload
+            del data_strs
+            job.data_byte_ranges = data_byte_ranges
+            data_upload_start = time.time()
+            internal_storage.put_data(data_key, data_bytes)
+            data_upload_end = time.time()
+            host_job_meta['host_data_upload_time'] = round(data_upload_end-data_upload_start, 6)
+
+        else:
+            # pass iteradata as part of the invocation payload
+            logger.debug('ExecutorID {} | JobID {} - Data per activation is < '
+                         '{}. Passing data through invocation payload'
+                         .format(executor_id, job_id, utils.sizeof_fmt(8*1024)))
+            job.data_key = None
+            job.data_byte_ranges = None
+            job.data_byte_strs = [utils.bytes_to_b64str(data_str) for data_str in data_strs]
+            host_job_meta['host_data_upload_time'] = 0
+    finally:
+        if func_upload:
+            func_upload.join()
+
+    if func_upload:
+        if func_upload_errors:
+            raise func_upload_errors[0]
+        uploaded_funcs[func_hash] = func_job_id
 
     host_job_meta['host_job_created_time'] = round(time.time() - host_job_meta['host_job_create_tstamp'], 6)
 
@@ -278,6 +325,53 @@ def _create_job(config, internal_storage, executor_id, job_id, func,
     return job
 
 
+def _get_file_hash(file_path):
+    """
+    Returns the md5 hash of a file. It is only computed again if the file
+    size or modification time changed since the previous call
+    """
+    stat = os.stat(file_path)
+    file_id = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _file_hashes.get(file_path)
+    if cached and cached[0] == file_id:
+        return cached[1]
+
+    file_hash = hashlib.md5()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024**2), b''):
+            file_hash.update(chunk)
+    file_hash = file_hash.hexdigest()[:16]
+    _file_hashes[file_path] = (file_id, file_hash)
+
+    return file_hash
+
+
+def _get_serializer(runtime_meta):
+    """
+    Returns the serializer of a runtime, given its runtime metadata
+    """
+    cached = _serializers.get(id(runtime_meta))
+    if cached and cached[0] is runtime_meta:
+        return cached[1]
+
+    serializer = SerializeIndependent(runtime_meta['preinstalls'])
+    # Keeping a reference to runtime_meta prevents its id from being reused
+    _serializers[id(runtime_meta)] = (runtime_meta, serializer)
+    if len(_serializers) > _SERIALIZERS_SIZE:
+        del _serializers[next(iter(_serializers))]
+
+    return serializer
+
+
+@lru_cache(maxsize=64)
+def _get_mod_paths_hash(mod_paths):
+    """
+    Returns the md5 hash of a set of module paths
+    """
+    return hashlib.md5(repr(sorted(mod_paths)).encode('utf-8')).hexdigest()[:16]
+
+
 def _store_func_and_modules(job_tmp_dir, func_key, func_str, module_data):
     ''' stores function and modules in temporary directory to be
     used later in optimized runtime
@@ -293,6 +387,7 @@ def _store_func_and_modules(job_tmp_dir, func_key, func_str, module_data):
         logger.debug("Writing Function dependencies to local disk")
 
         modules_path = '/'.join([job_tmp_dir, 'modules'])
+        created_dirs = set()
 
         for m_filename, m_data in module_data.items():
             m_path = os.path.dirname(m_filename)
@@ -300,13 +395,9 @@ def _store_func_and_modules(job_tmp_dir, func_key, func_str, module_data):
             if len(m_path) > 0 and m_path[0] == "/":
                 m_path = m_path[1:]
             to_make = os.path.join(modules_path, m_path)
-            try:
-                os.makedirs(to_make)
-            except OSError as e:
-                if e.errno == 17:
-                    pass
-                else:
-                    raise e
+            if to_make not in created_dirs:
+                os.makedirs(to_make, exist_ok=True)
+                created_dirs.add(to_make)
             full_filename = os.path.join(to_make, os.path.basename(m_filename))
 
             with open(full_filename, 'wb') as fid:
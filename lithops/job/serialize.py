@@ -21,6 +21,7 @@ import glob
 import importlib
 import logging
 import inspect
+import weakref
 import cloudpickle
 from pathlib import Path
 from dis import Bytecode
@@ -34,28 +35,33 @@ from lithops.libs.multyvac.module_dependency import ModuleDependencyAnalyzer
 logger = logging.getLogger(__name__)
 
 
+# func -> ([(analyzed function, referenced objects)], module dependencies)
+_func_cache = weakref.WeakKeyDictionary()
+
+
 class SerializeIndependent:
 
     def __init__(self, preinstalls):
-        self.preinstalled_modules = preinstalls
-        self.preinstalled_modules.append(['lithops', True])
+        self.preinstalled_modules = tuple(name for name, _ in preinstalls) + ('lithops',)
         self._modulemgr = None
 
     def __call__(self, list_of_objs, include_modules, exclude_modules):
         """
-        Serialize f, args, kwargs independently
+        Serialize f, args, kwargs independently.
+        The first object of list_of_objs must be the function
         """
         self._modulemgr = ModuleDependencyAnalyzer()
-        preinstalled_modules = [name for name, _ in self.preinstalled_modules]
-        self._modulemgr.ignore(preinstalled_modules)
+        self._modulemgr.ignore(self.preinstalled_modules)
         if not include_modules:
             self._modulemgr.ignore(exclude_modules)
 
         strs = []
         mods = []
-        for obj in list_of_objs:
-            mods.extend(self._module_inspect(obj))
-            strs.append(cloudpickle.dumps(obj))
+        for i, obj in enumerate(list_of_objs):
+            obj_str, obj_mods = self._serialize_func(obj) if i == 0 else \
+                (cloudpickle.dumps(obj), self._module_inspect(obj))
+            strs.append(obj_str)
+            mods.extend(obj_mods)
 
         # Add modules
         direct_modules = set()
@@ -89,9 +95,34 @@ class SerializeIndependent:
 
         return (strs, mod_paths)
 
-    def _module_inspect(self, obj):
+    def _serialize_func(self, func):
         """
-        inspect objects for module dependencies
+        Serializes the function and inspects it, reusing the module inspection
+        of a previous job when the same function object is submitted again.
+        The function is always pickled, as cloudpickle serializes it by value.
+        """
+        func_str = cloudpickle.dumps(func)
+        if not inspect.isfunction(func):
+            return func_str, self._module_inspect(func)
+
+        # The inspection is reused only if none of the functions it went
+        # through references other objects than in the previous job
+        cached = _func_cache.get(func)
+        if cached and all(_is_same_objects(refs, _get_referenced_objects(fn or func, func))
+                          for fn, refs in cached[0]):
+            return func_str, cached[1]
+
+        visited = []
+        func_mods = self._module_inspect(func, visited)
+        _func_cache[func] = ([(None if fn is func else fn, _get_referenced_objects(fn, func))
+                              for fn in visited], func_mods)
+
+        return func_str, func_mods
+
+    def _module_inspect(self, obj, visited=None):
+        """
+        inspect objects for module dependencies. The analyzed functions
+        are appended to visited, if given
         """
         worklist = []
         seen = set()
@@ -105,16 +136,16 @@ class SerializeIndependent:
             # the obj is the user's iterdata
             to_anayze = list(obj.values())
             for param in to_anayze:
-                if type(param).__module__ != "__builtin__":
-                    if inspect.isfunction(param):
-                        # it is a user defined function
-                        worklist.append(param)
-                    else:
-                        # it is a user defined class
-                        members = inspect.getmembers(param)
-                        for k, v in members:
-                            if inspect.ismethod(v):
-                                worklist.append(v)
+                if inspect.isfunction(param):
+                    # it is a user defined function
+                    worklist.append(param)
+                elif type(param).__module__ not in ('builtins', '__builtin__'):
+                    # it is a user defined class, builtin types don't
+                    # have user defined methods to analyze
+                    members = inspect.getmembers(param)
+                    for k, v in members:
+                        if inspect.ismethod(v):
+                            worklist.append(v)
         else:
             # The obj is the user's function but in form of a class
             members = inspect.getmembers(obj)
@@ -129,6 +160,8 @@ class SerializeIndependent:
 
         # The worklist is only used for analyzing functions
         for fn in worklist:
+            if visited is not None:
+                visited.append(fn)
             mods.add(fn.__module__)
             codeworklist = [fn]
 
@@ -191,6 +224,32 @@ class SerializeIndependent:
         return (None, None)
 
 
+def _get_referenced_objects(func, root):
+    """
+    Returns the code and the closure and global values of func, which are
+    kept referenced so that they can be compared by identity. A reference
+    to root is left out, otherwise its cache entry would never be released
+    """
+    code = func.__code__
+    referenced = [code]
+    for cell in func.__closure__ or ():
+        try:
+            referenced.append(cell.cell_contents)
+        except ValueError:
+            # Empty cell
+            referenced.append(cell)
+    referenced.extend(func.__globals__.get(name) for name in code.co_names)
+
+    return [None if obj is root else obj for obj in referenced]
+
+
+def _is_same_objects(objs_a, objs_b):
+    """
+    Checks that both lists hold the same objects, by identity
+    """
+    return len(objs_a) == len(objs_b) and all(a is b for a, b in zip(objs_a, objs_b))
+
+
 def create_module_data(mod_paths):
 
     module_data = {}
@@ -36,12 +36,13 @@ class Monitor(threading.Thread):
     """
     Monitor base class
     """
-    def __init__(self, job, internal_storage, token_bucket_q, generate_tokens, config):
+    def __init__(self, job, internal_storage, token_bucket_q, ready_event, generate_tokens, config):
         super().__init__()
         self.job = job
         self.internal_storage = internal_storage
         self.should_run = True
         self.token_bucket_q = token_bucket_q
+        self.ready_event = ready_event
         self.generate_tokens = generate_tokens
         self.config = config
         self.daemon = True
@@ -51,6 +52,23 @@ class Monitor(threading.Thread):
         self.workers_done = []
         self.callids_done_worker = {}
 
+        # vars for _get_future
+        self.futures_index = {}
+        self.futures_indexed = 0
+
+    def _get_future(self, call_id):
+        """
+        Returns the future of a given (executor_id, job_id, call_id) tuple,
+        or None if the job does not track it
+        """
+        # job.futures only grows, so only the new futures are indexed
+        if self.futures_indexed < len(self.job.futures):
+            for f in self.job.futures[self.futures_indexed:]:
+                self.futures_index[(f.executor_id, f.job_id, f.call_id)] = f
+            self.futures_indexed = len(self.job.futures)
+
+        return self.futures_index.get(call_id)
+
     def _all_ready(self):
         """
         Checks if all futures are ready, success or done
@@ -93,6 +111,7 @@ class Monitor(threading.Thread):
                                'call_id': fut.call_id,
                                'activation_id': fut.activation_id}
                 fut._set_ready(call_status)
+                self.ready_event.set()
 
     def _print_status_log(self):
         """prints a debug log showing the status of the job"""
@@ -106,8 +125,8 @@ class Monitor(threading.Thread):
 
 class RabbitmqMonitor(Monitor):
 
-    def __init__(self, job, internal_storage, token_bucket_q, generate_tokens, config):
-        super().__init__(job, internal_storage, token_bucket_q, generate_tokens, config)
+    def __init__(self, job, internal_storage, token_bucket_q, ready_event, generate_tokens, config):
+        super().__init__(job, internal_storage, token_bucket_q, ready_event, generate_tokens, config)
 
         self.rabbit_amqp_url = config.get('amqp_url')
         self.queue = 'lithops-{}'.format(self.job.job_key)
@@ -147,22 +166,21 @@ class RabbitmqMonitor(Monitor):
         """
         Assigns a call_status to its future
         """
-        not_running_futures = [f for f in self.job.futures if not (f.running or f.ready or f.success or f.done)]
-        for f in not_running_futures:
-            calljob_id = (call_status['executor_id'], call_status['job_id'], call_status['call_id'])
-            if (f.executor_id, f.job_id, f.call_id) == calljob_id:
-                f._set_running(call_status)
+        calljob_id = (call_status['executor_id'], call_status['job_id'], call_status['call_id'])
+        f = self._get_future(calljob_id)
+        if f and not (f.running or f.ready or f.success or f.done):
+            f._set_running(call_status)
 
     def _tag_future_as_ready(self, call_status):
         """
         tags a future as ready based on call_status
         """
-        not_ready_futures = [f for f in self.job.futures if not (f.ready or f.success or f.done)]
-        for f in not_ready_futures:
-            calljob_id = (call_status['executor_id'], call_status['job_id'], call_status['call_id'])
-            if (f.executor_id, f.job_id, f.call_id) == calljob_id:
-                if not self._check_new_futures(call_status, f):
-                    f._set_ready(call_status)
+        calljob_id = (call_status['executor_id'], call_status['job_id'], call_status['call_id'])
+        f = self._get_future(calljob_id)
+        if f and not (f.ready or f.success or f.done):
+            if not self._check_new_futures(call_status, f):
+                f._set_ready(call_status)
+            self.ready_event.set()
 
     def _generate_tokens(self, call_status):
         """
@@ -220,8 +238,8 @@ class StorageMonitor(Monitor):
     THREADPOOL_SIZE = 64
     WAIT_DUR_SEC = 2  # Check interval
 
-    def __init__(self, job, internal_storage, token_bucket_q, generate_tokens, config):
-        super().__init__(job, internal_storage, token_bucket_q, generate_tokens, config)
+    def __init__(self, job, internal_storage, token_bucket_q, ready_event, generate_tokens, config):
+        super().__init__(job, internal_storage, token_bucket_q, ready_event, generate_tokens, config)
 
         # vars for _generate_tokens
         self.callids_running_worker = {}
@@ -245,15 +263,14 @@ class StorageMonitor(Monitor):
         Mark which futures are in running status based on callids_running
         """
         current_time = time.time()
-        not_running_futures = [f for f in self.job.futures if not (f.running or f.ready or f.success or f.done)]
         callids_running_to_process = callids_running - self.callids_running_processed_timeout
-        for f in not_running_futures:
-            for call in callids_running_to_process:
-                if f.invoked and (f.executor_id, f.job_id, f.call_id) == call[0]:
-                    call_status = {'type': '__init__',
-                                   'activation_id': call[1],
-                                   'worker_start_tstamp': current_time}
-                    f._set_running(call_status)
+        for call in callids_running_to_process:
+            f = self._get_future(call[0])
+            if f and f.invoked:
+                call_status = {'type': '__init__',
+                               'activation_id': call[1],
+                               'worker_start_tstamp': current_time}
+                f._set_running(call_status)
 
         self.callids_running_processed_timeout.update(callids_running_to_process)
         self._future_timeout_checker(self.job.futures)
@@ -262,16 +279,16 @@ class StorageMonitor(Monitor):
         """
         Mark which futures has a call_status ready to be downloaded
         """
-        not_ready_futures = [f for f in self.job.futures if not (f.ready or f.success or f.done)]
         callids_done_to_process = callids_done - self.callids_done_processed_status
         fs_to_query = []
 
         ten_percent = int(len(self.job.futures) * (10 / 100))
         if len(self.job.futures) - len(callids_done) <= max(10, ten_percent):
-            fs_to_query = not_ready_futures
+            fs_to_query = [f for f in self.job.futures if not (f.ready or f.success or f.done)]
         else:
-            for f in not_ready_futures:
-                if (f.executor_id, f.job_id, f.call_id) in callids_done_to_process:
+            for call_id in callids_done_to_process:
+                f = self._get_future(call_id)
+                if f and not (f.ready or f.success or f.done):
                     fs_to_query.append(f)
 
         if not fs_to_query:
@@ -286,6 +303,7 @@ class StorageMonitor(Monitor):
             else:
                 return None
 
+        call_ids_processed = set()
         try:
             pool = cf.ThreadPoolExecutor(max_workers=self.THREADPOOL_SIZE)
             call_ids_processed = set(pool.map(get_status, fs_to_query))
@@ -303,6 +321,9 @@ class StorageMonitor(Monitor):
         except Exception:
             pass
 
+        if call_ids_processed:
+            self.ready_event.set()
+
     def _generate_tokens(self, callids_running, callids_done):
         """
         Method that generates new tokens
@@ -351,6 +372,11 @@ class StorageMonitor(Monitor):
             callids_running, callids_done = \
                 self.internal_storage.get_job_status(self.job.executor_id, self.job.job_id)
 
+            if getattr(self.job, 'call_ids_range', None):
+                # Only a range of the job calls is tracked (remote invoker fanout)
+                callids_running = {c for c in callids_running if self._get_future(c[0])}
+                callids_done = {c for c in callids_done if self._get_future(c)}
+
             # verify if there are new callids_done and reduce the sleep
             new_callids_done = callids_done - self.callids_done_processed_status
             if len(new_callids_done) > 0:
@@ -377,6 +403,7 @@ class JobMonitor:
         self.config = config
         self.monitors = {}
         self.token_bucket_q = queue.Queue()
+        self.ready_event = threading.Event()
 
     def stop(self, job_keys=None):
         """
@@ -403,6 +430,15 @@ class JobMonitor:
             return False
         return self.monitors[job_key].is_alive()
 
+    def wait_ready(self, timeout=None):
+        """
+        Blocks until any monitor tags a future as ready, or until the
+        timeout expires. Returns True if a notification was received
+        """
+        notified = self.ready_event.wait(timeout)
+        self.ready_event.clear()
+        return notified
+
     def get_active_jobs(self):
         """
         Returns a list of active job monitors
@@ -420,6 +456,7 @@ class JobMonitor:
         Monitor = getattr(lithops.monitor, '{}Monitor'.format(self.backend.capitalize()))
         jm = Monitor(job=job, internal_storage=internal_storage,
                      token_bucket_q=self.token_bucket_q,
+                     ready_event=self.ready_event,
                      generate_tokens=generate_tokens, config=self.config)
         self.monitors[job.job_key] = jm
         return jm
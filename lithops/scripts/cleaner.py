@@ -36,7 +36,8 @@ def clean():
     def clean_file(file_name):
         file_location = os.path.join(CLEANER_DIR, file_name)
 
-        if file_location in [CLEANER_LOG_FILE, CLEANER_PID_FILE]:
+        if file_location in [CLEANER_LOG_FILE, CLEANER_PID_FILE] or \
+           file_location.endswith('.tmp'):
             return
 
         with open(file_location, 'rb') as pk:
@@ -75,7 +76,9 @@ def clean():
             os.remove(file_location)
 
     while True:
-        files_to_clean = os.listdir(CLEANER_DIR)
+        # Files still being written by an executor are skipped
+        files_to_clean = [file_name for file_name in os.listdir(CLEANER_DIR)
+                          if not file_name.endswith('.tmp')]
         if len(files_to_clean) <= 2:
             break
         with ThreadPoolExecutor(max_workers=32) as ex:
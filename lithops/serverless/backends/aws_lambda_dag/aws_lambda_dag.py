@@ -16,6 +16,11 @@
 
 import functools
 import json
+import concurrent.futures as cf
+
+MAX_CONCURRENT_TASKS = 100
+
+FUNCTIONS = dict() # functions registered to be available to the Orchestrator
 
 # ----------------------------------------------------------------
 class Orchestrator:
@@ -23,19 +28,82 @@ class Orchestrator:
         self.functions = dict()
         self.dag = ''
         self.dipendencies = dict() # keep track of the inputs needed to run a task, and their availability
+        self.dependents = dict() # tasks that need the output of a task
         self.task_queue = list() # tasks that can be executed
         self.task_count = 0 # total number of tasks remaining
 
+    def load(self, keys):
+        """
+        Builds the dependency graph. Each key is a task name, optionally
+        followed by the tasks it depends on: 'task: dep1, dep2'
+        """
+        for key in keys:
+            task, _, deps = key.partition(':')
+            task = task.strip()
+            if not task:
+                continue
+            deps = [dep.strip() for dep in deps.split(',') if dep.strip()]
+            self.dipendencies[task] = deps
+            self.dependents.setdefault(task, [])
+            for dep in deps:
+                self.dependents.setdefault(dep, []).append(task)
+
+        unknown = set(self.dependents) - set(self.dipendencies)
+        if unknown:
+            raise ValueError('Tasks {} are not defined in the DAG'.format(sorted(unknown)))
+
+        self.task_queue = [task for task, deps in self.dipendencies.items() if not deps]
+        self.task_count = len(self.dipendencies)
+
+        # Check that all the tasks can be reached before running any of them
+        remaining = {task: len(deps) for task, deps in self.dipendencies.items()}
+        reachable = list(self.task_queue)
+        for task in reachable:
+            for dependent in self.dependents[task]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    reachable.append(dependent)
+
+        if len(reachable) < self.task_count:
+            raise ValueError('The DAG has a cycle between tasks {}'
+                             .format(sorted(set(self.dipendencies) - set(reachable))))
+
+    def run(self, functions, args):
+        """
+        Runs the tasks as soon as all their dependencies are done. Tasks
+        without dependencies get args, the others get the results of their
+        dependencies, in the order they are listed
+        """
+        returns = dict()
+        remaining = {task: len(deps) for task, deps in self.dipendencies.items()}
+
+        with cf.ThreadPoolExecutor(max_workers=MAX_CONCURRENT_TASKS) as executor:
+            running = dict()
+
+            def submit(task):
+                deps = self.dipendencies[task]
+                task_args = [returns[dep] for dep in deps] if deps else args
+                running[executor.submit(functions[task], *task_args)] = task
+
+            for task in self.task_queue:
+                submit(task)
+
+            while running:
+                done, _ = cf.wait(running, return_when=cf.FIRST_COMPLETED)
+                for future in done:
+                    task = running.pop(future)
+                    returns[task] = future.result()
+                    for dependent in self.dependents[task]:
+                        remaining[dependent] -= 1
+                        if remaining[dependent] == 0:
+                            submit(dependent)
+
+        return returns
+
 
 def register(func):
     """Register a function to be available to the Orchestrator"""
-    if not('FUNCTIONS' in globals()):
-        global FUNCTIONS
-        FUNCTIONS = dict()
-        FUNCTIONS[func.__name__] = func
-    else:
-        FUNCTIONS = globals()['FUNCTIONS']
-        FUNCTIONS[func.__name__] = func
+    FUNCTIONS[func.__name__] = func
     return func
 
 
@@ -43,17 +111,12 @@ def register(func):
 def DAG(dag_path):
     
     # read the DAG
-    keys = list()
-    f = open(dag_path, "r")
-    for line in f:
-        keys.append(line.strip())
+    with open(dag_path, "r") as f:
+        keys = f.read().splitlines()
 
-    # TODO create data structures for task execution
-    # - dictionary with the dependencies ( chi dipende da questo? questo)
-    # - counter delle dipendenze, quando raggiunge lo zero può essere messo in coda 
-    # - scheduler che guarda la coda e schedula cose
-
-    
+    orchestrator = Orchestrator()
+    orchestrator.dag = dag_path
+    orchestrator.load(keys)
 
     def decorator_DAG(func):
         @functools.wraps(func)
@@ -76,12 +139,6 @@ def DAG(dag_path):
 
             
 
-            returns = dict()
-            for key in keys:
-
-                value = FUNCTIONS[key](*kwargs.values())
-                returns[key] = value
-
-            return returns
+            return orchestrator.run(FUNCTIONS, list(kwargs.values()))
         return wrapper_DAG
     return decorator_DAG
@@ -14,9 +14,12 @@
 # limitations under the License.
 #
 
+import io
 import logging
 import boto3
 import botocore
+from boto3.s3.transfer import TransferConfig
+from boto3.exceptions import S3UploadFailedError
 from lithops.storage.utils import StorageNoSuchKeyError
 from lithops.constants import STORAGE_CLI_MSG
 
@@ -24,6 +27,8 @@ logger = logging.getLogger(__name__)
 
 OBJ_REQ_RETRIES = 5
 CONN_READ_TIMEOUT = 10
+MULTIPART_CHUNK_SIZE = 8 * 1024**2
+MULTIPART_CONCURRENCY = 8
 
 
 class S3Backend:
@@ -52,6 +57,13 @@ class S3Backend:
             endpoint_url=service_endpoint
         )
 
+        # Large objects are uploaded in concurrent parts
+        self.transfer_config = TransferConfig(
+            multipart_threshold=MULTIPART_CHUNK_SIZE,
+            multipart_chunksize=MULTIPART_CHUNK_SIZE,
+            max_concurrency=MULTIPART_CONCURRENCY
+        )
+
         msg = STORAGE_CLI_MSG.format('S3')
         logger.info("{} - Endpoint: {}".format(msg, service_endpoint))
 
@@ -71,6 +83,19 @@ class S3Backend:
         :return: None
         '''
         try:
+            if isinstance(data, (bytes, bytearray)) and len(data) > MULTIPART_CHUNK_SIZE:
+                try:
+                    self.s3_client.upload_fileobj(io.BytesIO(data), bucket_name, key,
+                                                  Config=self.transfer_config)
+                except S3UploadFailedError as e:
+                    # The transfer manager wraps the ClientError of the failed request
+                    cause = e.__cause__ or e.__context__
+                    if isinstance(cause, botocore.exceptions.ClientError):
+                        raise cause
+                    raise e
+                logger.debug('PUT Object {} - Size: {} - OK (multipart)'.format(key, len(data)))
+                return
+
             res = self.s3_client.put_object(Bucket=bucket_name, Key=key, Body=data)
             status = 'OK' if res['ResponseMetadata']['HTTPStatusCode'] == 200 else 'Error'
             try:
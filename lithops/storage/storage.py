@@ -17,6 +17,7 @@
 
 import os
 import json
+import zlib
 import logging
 import itertools
 import importlib
@@ -192,6 +193,8 @@ class InternalStorage:
         self.storage = Storage(storage_config=storage_config)
         self.backend = self.storage.backend
         self.bucket = self.storage.bucket
+        # executor_id -> {function hash: ID of its uploaded function object}
+        self.uploaded_funcs = {}
 
     def get_client(self):
         """
@@ -218,12 +221,12 @@ class InternalStorage:
 
     def put_func(self, key, func):
         """
-        Put serialized function into storage.
+        Put serialized function into storage. It is stored compressed.
         :param key: function key
         :param func: serialized function
         :return: None
         """
-        return self.storage.put_object(self.bucket, key, func)
+        return self.storage.put_object(self.bucket, key, zlib.compress(func, 1))
 
     def get_data(self, key, stream=False, extra_get_args={}):
         """
@@ -239,7 +242,7 @@ class InternalStorage:
         :param key: function key
         :return: serialized function
         """
-        return self.storage.get_object(self.bucket, key)
+        return zlib.decompress(self.storage.get_object(self.bucket, key))
 
     def get_job_status(self, executor_id, job_id):
         """
@@ -28,6 +28,7 @@ import lithops
 import zipfile
 import platform
 import logging.config
+import weakref
 import subprocess as sp
 
 from lithops import constants
@@ -102,8 +103,7 @@ class FuturesList(list):
         for fut in self:
             fut._produce_output = False
         if not hasattr(self, 'alt_list'):
-            self.alt_list = []
-            self.alt_list.extend(self)
+            self.alt_list = list(self)
         self.alt_list.extend(fs)
         self.clear()
         self.extend(fs)
@@ -297,13 +297,10 @@ def is_notebook():
 
 def convert_bools_to_string(extra_env):
     """
-    Converts all booleans of a dictionary to a string
+    Returns a copy of a dictionary with all its booleans converted to a string
     """
-    for key in extra_env:
-        if type(extra_env[key]) == bool:
-            extra_env[key] = str(extra_env[key])
-
-    return extra_env
+    return {key: str(value) if type(value) is bool else value
+            for key, value in extra_env.items()}
 
 
 def sizeof_fmt(num, suffix='B'):
@@ -412,7 +409,7 @@ def format_data(iterdata, extra_args):
     # Format iterdata in a proper way
     if type(iterdata) in [range, set]:
         data = list(iterdata)
-    elif type(iterdata) != list and type(iterdata) != FuturesList:
+    elif not isinstance(iterdata, list):
         data = [iterdata]
     else:
         data = iterdata
@@ -440,15 +437,20 @@ def format_data(iterdata, extra_args):
     return data
 
 
-def verify_args(func, iterdata, extra_args):
+# func -> signature without the parameters filled in by lithops
+_verify_signatures = weakref.WeakKeyDictionary()
 
-    if isinstance(iterdata, FuturesList):
-        # this is required for function chaining
-        return [{'future': f} for f in iterdata]
 
-    data = format_data(iterdata, extra_args)
+def _get_verify_signature(func):
+    """
+    Returns the signature of func without the parameters filled in by lithops.
+    Callables that are unhashable or not weak referenceable are not cached
+    """
+    try:
+        return _verify_signatures[func]
+    except (KeyError, TypeError):
+        pass
 
-    # Verify parameters
     non_verify_args = ['ibm_cos', 'storage', 'id', 'rabbitmq']
     func_sig = inspect.signature(func)
 
@@ -458,11 +460,33 @@ def verify_args(func, iterdata, extra_args):
             new_parameters.append(func_sig.parameters[param])
 
     new_func_sig = func_sig.replace(parameters=new_parameters)
+    try:
+        _verify_signatures[func] = new_func_sig
+    except TypeError:
+        pass
+
+    return new_func_sig
+
+
+def verify_args(func, iterdata, extra_args):
+    """
+    Checks iterdata against the function signature and converts each element
+    to a kwargs dict
+    """
+    if isinstance(iterdata, FuturesList):
+        # this is required for function chaining
+        return [{'future': f} for f in iterdata]
+
+    data = format_data(iterdata, extra_args)
+
+    # Verify parameters
+    new_func_sig = _get_verify_signature(func)
+    func_args = set(new_func_sig.parameters)
 
     new_data = list()
     for elem in data:
         if type(elem) == dict:
-            if set(list(new_func_sig.parameters.keys())) <= set(elem):
+            if func_args <= set(elem):
                 new_data.append(elem)
             else:
                 raise ValueError("Check the args names in the data. "
@@ -16,11 +16,10 @@
 
 import signal
 import logging
-import time
 import concurrent.futures as cf
 from functools import partial
 from lithops.utils import is_unix_system, timeout_handler, \
-    is_notebook, is_lithops_worker, FuturesList
+    is_notebook, is_lithops_worker
 from lithops.storage import InternalStorage
 from lithops.monitor import JobMonitor
 from types import SimpleNamespace
@@ -54,7 +53,8 @@ def wait(fs, internal_storage=None, throw_except=True, timeout=None,
     :param download_results: Download results. Default false (Only get statuses)
     :param timeout: Timeout of waiting for results.
     :param threadpool_zise: Number of threads to use. Default 64
-    :param wait_dur_sec: Time interval between each check.
+    :param wait_dur_sec: Max time to block between checks if the job monitor
+                         does not notify any ready future.
 
     :return: `(fs_done, fs_notdone)`
         where `fs_done` is a list of futures that have completed
@@ -64,18 +64,14 @@ def wait(fs, internal_storage=None, throw_except=True, timeout=None,
     if not fs:
         return
 
-    if type(fs) != list and type(fs) != FuturesList:
+    if not isinstance(fs, list):
         fs = [fs]
 
     if download_results:
         msg = 'ExecutorID {} - Getting results from functions'.format(fs[0].executor_id)
-        fs_done = [f for f in fs if f.done]
-        fs_not_done = [f for f in fs if not f.done]
-
     else:
         msg = 'ExecutorID {} - Waiting for functions to complete'.format(fs[0].executor_id)
-        fs_done = [f for f in fs if f.success or f.done]
-        fs_not_done = [f for f in fs if not (f.success or f.done)]
+    fs_done, fs_not_done = _split_done(fs, download_results)
 
     logger.info(msg)
 
@@ -98,38 +94,49 @@ def wait(fs, internal_storage=None, throw_except=True, timeout=None,
                     total=len(fs), disable=None)
         pbar.update(len(fs_done))
 
+    # Thread pool shared by all the status/result downloads of this wait call
+    pool = cf.ThreadPoolExecutor(max_workers=threadpool_size)
+
     try:
         jobs = _create_jobs_from_futures(fs, internal_storage)
         if not job_monitor:
             job_monitor = JobMonitor(backend='storage')
             [job_monitor.create(**job_data).start() for job_data in jobs]
 
-        sleep_sec = wait_dur_sec if job_monitor.backend == 'storage' else 0.3
-
         if return_when == ALL_COMPLETED:
-            while not _all_done(fs, download_results):
+            # Only the futures still pending are checked on each iteration
+            fs_pending = fs_not_done
+            while fs_pending:
+                total_fs = len(fs)
+                new_data = 0
                 for job_data in jobs:
-                    new_data = _get_job_data(fs, job_data, pbar=pbar,
-                                             throw_except=throw_except,
-                                             download_results=download_results,
-                                             threadpool_size=threadpool_size)
-                time.sleep(0 if new_data else sleep_sec)
+                    new_data += _get_job_data(fs, job_data, pbar=pbar,
+                                              throw_except=throw_except,
+                                              download_results=download_results,
+                                              pool=pool)
+                # new futures returned by the functions are appended to fs
+                fs_pending = [f for f in chain(fs_pending, fs[total_fs:])
+                              if not _is_done(f, download_results)]
+                if fs_pending and not new_data:
+                    job_monitor.wait_ready(timeout=wait_dur_sec)
 
         elif return_when == ANY_COMPLETED:
             while not _any_done(fs, download_results):
+                new_data = 0
                 for job_data in jobs:
-                    new_data = _get_job_data(fs, job_data, pbar=pbar,
-                                             throw_except=throw_except,
-                                             download_results=download_results,
-                                             threadpool_size=threadpool_size)
-                time.sleep(0 if new_data else sleep_sec)
+                    new_data += _get_job_data(fs, job_data, pbar=pbar,
+                                              throw_except=throw_except,
+                                              download_results=download_results,
+                                              pool=pool)
+                if not new_data:
+                    job_monitor.wait_ready(timeout=wait_dur_sec)
 
         elif return_when == ALWAYS:
             for job_data in jobs:
                 _get_job_data(fs, job_data, pbar=pbar,
                               throw_except=throw_except,
                               download_results=download_results,
-                              threadpool_size=threadpool_size)
+                              pool=pool)
 
     except KeyboardInterrupt as e:
         if download_results:
@@ -147,6 +154,7 @@ def wait(fs, internal_storage=None, throw_except=True, timeout=None,
         raise e
 
     finally:
+        pool.shutdown(wait=False)
         if is_unix_system():
             signal.alarm(0)
         if pbar and not pbar.disable:
@@ -154,14 +162,7 @@ def wait(fs, internal_storage=None, throw_except=True, timeout=None,
             if not is_notebook():
                 print()
 
-    if download_results:
-        fs_done = [f for f in fs if f.done]
-        fs_notdone = [f for f in fs if not f.done]
-    else:
-        fs_done = [f for f in fs if f.success or f.done]
-        fs_notdone = [f for f in fs if not f.success and not f.done]
-
-    return fs_done, fs_notdone
+    return _split_done(fs, download_results)
 
 
 def get_result(fs, throw_except=True, timeout=None,
@@ -179,13 +180,13 @@ def get_result(fs, throw_except=True, timeout=None,
     :param WAIT_DUR_SEC: Time interval between each check.
     :return: The result of the future/s
     """
-    if type(fs) != list and type(fs) != FuturesList:
+    if not isinstance(fs, list):
         fs = [fs]
 
     fs_done, _ = wait(fs=fs, throw_except=throw_except,
                       timeout=timeout, download_results=True,
                       internal_storage=internal_storage,
-                      threadpool_zise=threadpool_zise,
+                      threadpool_size=threadpool_zise,
                       wait_dur_sec=wait_dur_sec)
     result = []
     fs_done = [f for f in fs_done if not f.futures and f._produce_output]
@@ -225,14 +226,29 @@ def _create_jobs_from_futures(fs, internal_storage):
     return jobs
 
 
-def _all_done(fs, download_results):
+def _is_done(f, download_results):
     """
-    Checks if all futures are ready or done
+    Checks if a future is done, or ready when results are not downloaded
     """
     if download_results:
-        return all([f.done for f in fs])
+        return f.done
     else:
-        return all([f.success or f.done for f in fs])
+        return f.success or f.done
+
+
+def _split_done(fs, download_results):
+    """
+    Splits the futures into done and not done lists in a single pass
+    """
+    fs_done = []
+    fs_not_done = []
+    for f in fs:
+        if _is_done(f, download_results):
+            fs_done.append(f)
+        else:
+            fs_not_done.append(f)
+
+    return fs_done, fs_not_done
 
 
 def _any_done(fs, download_results):
@@ -245,7 +261,7 @@ def _any_done(fs, download_results):
         return any([f.success or f.done for f in fs])
 
 
-def _get_job_data(fs, job_data, download_results, throw_except, threadpool_size, pbar):
+def _get_job_data(fs, job_data, download_results, throw_except, pool, pbar):
     """
     Downloads all status/results from ready futures
     """
@@ -273,12 +289,10 @@ def _get_job_data(fs, job_data, download_results, throw_except, threadpool_size,
     def get_status(f):
         f.status(throw_except=throw_except, internal_storage=internal_storage)
 
-    pool = cf.ThreadPoolExecutor(max_workers=threadpool_size)
     if download_results:
         list(pool.map(get_result, fs_to_wait_on))
     else:
         list(pool.map(get_status, fs_to_wait_on))
-    pool.shutdown()
 
     if pbar:
         for f in fs_to_wait_on:
@@ -14,9 +14,12 @@
 # limitations under the License.
 #
 import os
+import math
 import time
+import random
 import logging
 from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
 
 from lithops.serverless import ServerlessHandler
 from lithops.monitor import JobMonitor
@@ -59,20 +62,88 @@ class FaaSRemoteInvoker(FaaSInvoker):
     """
     Module responsible to perform the invocations against the serverless compute backend
     """
+    FANOUT_MIN_CALLS = 100
+    FANOUT_SPAWN_RETRIES = 5
+
+    def _fanout(self, job):
+        """
+        Spawns sqrt(N) remote invokers, each one in charge of invoking a range
+        of sqrt(N) activations, instead of invoking all of them from here.
+        Returns False if the job is not split
+        """
+        monitoring_backend = self.config['lithops']['monitoring'].lower()
+        if getattr(job, 'call_ids_range', None) or monitoring_backend != 'storage' \
+           or job.total_calls <= self.FANOUT_MIN_CALLS:
+            return False
+
+        total_activations = math.ceil(job.total_calls / job.chunksize)
+        total_invokers = min(int(math.sqrt(total_activations)), self.workers)
+        if total_invokers < 2:
+            # A single remote invoker would only add a cold start
+            return False
+
+        # Ranges are aligned to the chunksize to keep the same activations
+        range_size = math.ceil(total_activations / total_invokers) * job.chunksize
+        workers = max(1, self.workers // total_invokers)
+
+        sub_jobs = []
+        for start in range(0, job.total_calls, range_size):
+            end = min(start + range_size, job.total_calls)
+            sub_job = job.__dict__.copy()
+            sub_job['call_ids_range'] = [start, end]
+            sub_job['remote_invoker_workers'] = workers
+            # Each remote invoker only gets the data of its range of calls
+            sub_job['data_offset'] = start
+            if job.data_key:
+                sub_job['data_byte_ranges'] = job.data_byte_ranges[start:end]
+            else:
+                sub_job['data_byte_strs'] = job.data_byte_strs[start:end]
+            sub_jobs.append(SimpleNamespace(**sub_job))
+
+        logger.info('ExecutorID {} | JobID {} - Spawning {} remote invokers with '
+                    '{} workers each'.format(job.executor_id, job.job_id,
+                                             len(sub_jobs), workers))
+
+        with ThreadPoolExecutor(len(sub_jobs)) as executor:
+            list(executor.map(self._spawn_remote_invoker, sub_jobs))
+
+        return True
+
+    def _spawn_remote_invoker(self, job):
+        """
+        Invokes a remote invoker, retrying when the spawn fails, e.g. because
+        the concurrency quota of the backend is reached
+        """
+        for attempt in range(self.FANOUT_SPAWN_RETRIES):
+            try:
+                return self._invoke_job_remote(job)
+            except Exception as e:
+                if attempt == self.FANOUT_SPAWN_RETRIES - 1:
+                    raise e
+                logger.debug('ExecutorID {} | JobID {} - Unable to spawn remote invoker '
+                             'for calls {}, retrying'.format(job.executor_id, job.job_id,
+                                                             job.call_ids_range))
+                time.sleep(random.randint(0, 5))
 
     def run_job(self, job):
         """
         Run a job
         """
+        if self._fanout(job):
+            logger.info('Remote Invoker Finished')
+            return
+
+        if getattr(job, 'remote_invoker_workers', None):
+            self.workers = job.remote_invoker_workers
+
         job_monitor = self.job_monitor.create(job, self.internal_storage, generate_tokens=True)
         self._run_job(job)
         job_monitor.start()
 
-        while self.pending_calls_q.qsize() > 0:
-            time.sleep(1)
+        # Blocks until all the pending calls are invoked
+        self.pending_calls_q.join()
 
         job_monitor.stop()  # Stop job monitor thread
         self.stop()  # Stop async invokers threads
-        time.sleep(5)
 
         logger.info('Remote Invoker Finished')
@@ -59,6 +59,7 @@ def get_function_and_modules(job, internal_storage):
         logger.debug("Writing function dependencies to {}".format(module_path))
         os.makedirs(module_path, exist_ok=True)
         sys.path.append(module_path)
+        created_dirs = set()
 
         for m_filename, m_data in loaded_func_all['module_data'].items():
             m_path = os.path.dirname(m_filename)
@@ -66,13 +67,9 @@ def get_function_and_modules(job, internal_storage):
             if len(m_path) > 0 and m_path[0] == "/":
                 m_path = m_path[1:]
             to_make = os.path.join(module_path, m_path)
-            try:
-                os.makedirs(to_make)
-            except OSError as e:
-                if e.errno == 17:
-                    pass
-                else:
-                    raise e
+            if to_make not in created_dirs:
+                os.makedirs(to_make, exist_ok=True)
+                created_dirs.add(to_make)
             full_filename = os.path.join(to_make, os.path.basename(m_filename))
             # logger.debug('Writing {}'.format(full_filename))
 
@@ -108,7 +105,7 @@ def get_function_data(job, internal_storage):
         else:
             loaded_data.append(data_obj)
     else:
-        loaded_data = [eval(byte_str) for byte_str in job.data_byte_strs]
+        loaded_data = [b64str_to_bytes(byte_str) for byte_str in job.data_byte_strs]
 
     return loaded_data
 